@@ -6,20 +6,14 @@
 
 from __future__ import print_function, unicode_literals
 
-import argparse
 import base64
-import collections
 import errno
-import glob
+import functools
 import io
 import json
 import logging
-import logging.config
 import os
-import platform
-import re
-import shutil
-import subprocess
+import string
 import sys
 import warnings
 
@@ -34,6 +28,30 @@ except ImportError:
     # Use this error when decoder exceptions are thrown at this program runtime.
     JSONDecodeError = ValueError
 
+try:
+    from importlib.util import find_spec
+except ImportError:
+    # Use this function to find installed python packages on the previous python versions.
+    from pkgutil import find_loader as find_spec
+
+try:
+    from functools import lru_cache
+except ImportError:
+
+    def lru_cache(maxsize=None):  # keep all the results on the previous python versions
+        def decorator(function):
+            cache = {}
+
+            def wrapper(*args):
+                if args not in cache:
+                    cache[args] = function(*args)
+                return cache[args]
+
+            wrapper.cache_clear = cache.clear
+            return wrapper
+
+        return decorator
+
 
 LOGO_32_32 = b"""
 iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAABmJLR0QA/wD/AP+gvaeTAAAACXBI
@@ -100,12 +118,14 @@ O7YWYq0HdXqRXr3JlpcAuQ/1z24XKfdB2Un8rzGevPkyjI6sBvhVwD5wka/98NEL4S+RxmOysOt8
 bn8AAAAASUVORK5CYII=
 """
 
-KERNEL_NAME_PATTERN = re.compile(r"^[a-z0-9._\-]+$", re.IGNORECASE)
+# Decode python logos once to write them without extra work for each new kernel.
+_LOGO_BYTES = {
+    "logo-32x32.png": base64.b64decode(LOGO_32_32),
+    "logo-64x64.png": base64.b64decode(LOGO_64_64),
+}
 
-# Create a structure to store information about the location of a kernel on the current machine.
-_kernel_info = collections.namedtuple(typename="kernel_info", field_names=("name", "path"))
+KERNEL_NAME_CHARACTERS = frozenset(string.ascii_letters + string.digits + "._-")
 
-logging.basicConfig(format="%(levelname)s :: %(name)s :: %(message)s")
 # Create a new instance of the preferred reporting system for this program.
 _logger = logging.getLogger("notebook_environments")
 
@@ -133,6 +153,7 @@ def _in_virtual_environment():
     return bool(os.getenv("CONDA_PREFIX") or os.getenv("VIRTUAL_ENV") or is_using_venv)
 
 
+@lru_cache(maxsize=None)
 def _get_data_path(*subdirs):
     paths_spec = {
         # Set the main path to store notebook server settings on mac operating systems.
@@ -141,6 +162,8 @@ def _get_data_path(*subdirs):
         "linux": os.path.join(os.path.expanduser("~/.local/share/jupyter"), *subdirs),
     }
 
+    import platform  # this module is required only to find the current operating system
+
     try:
         return paths_spec[platform.system().lower()]
     except KeyError:
@@ -152,7 +175,7 @@ def _get_data_path(*subdirs):
 def _get_kernel_name():
     name = os.path.basename(sys.prefix)
 
-    if not KERNEL_NAME_PATTERN.match(name):
+    if not name or not KERNEL_NAME_CHARACTERS.issuperset(name):
         _logger.error("It's impossible to create a new kernel name with invalid characters.")
         # Stop this program runtime and return the exit status code.
         sys.exit(errno.EPERM)
@@ -174,12 +197,14 @@ def _list_kernels_in(path):
     for item in content:
         abspath = os.path.join(path, item)
 
-        if os.path.isdir(abspath) and os.path.isfile(os.path.join(abspath, "kernel.json")):
-            # Generate information about the location of a kernel on the current machine.
-            yield _kernel_info(name=item, path=abspath)
+        # A kernel specification can only exist inside a directory so this check covers both.
+        if os.path.isfile(os.path.join(abspath, "kernel.json")):
+            # Generate the name and location of a kernel on the current machine.
+            yield item, abspath
 
 
-def _write_kernel_specification(path):
+@lru_cache(maxsize=None)
+def _get_kernel_specification():
     kernel_spec = {
         "argv": [
             sys.executable,
@@ -193,18 +218,38 @@ def _write_kernel_specification(path):
         "language": "python",
     }
 
+    # Serialize a kernel specification once because it depends only on the working interpreter.
+    return _to_unicode(json.dumps(kernel_spec, ensure_ascii=False, indent=2)).encode("utf-8")
+
+
+def _write_kernel_files(path):
+    kernel_files = [("kernel.json", _get_kernel_specification())]
+    kernel_files.extend(_LOGO_BYTES.items())
+
     try:
-        with io.open(os.path.join(path, "kernel.json"), mode="wt", encoding="utf-8") as stream_out:
-            # Create a new kernel specification on the current machine.
-            stream_out.write(_to_unicode(json.dumps(kernel_spec, ensure_ascii=False, indent=2)))
+        for file_name, content in kernel_files:
+            # Create a new kernel specification or python logo without buffered file objects.
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            fd = os.open(os.path.join(path, file_name), flags, 0o644)
+            try:
+                while content:
+                    content = content[os.write(fd, content):]
+            finally:
+                os.close(fd)
     except (IOError, OSError) as err:
-        _logger.error("It's impossible to create a new specification on the current machine.")
+        _logger.error("It's impossible to create kernel files on the current machine.")
         _logger.debug("An unexpected error occurred at this program runtime:", exc_info=True)
         # Stop this program runtime and return the exit status code.
         sys.exit(getattr(err, "errno", errno.EIO))
 
 
 def _provide_required_packages():
+    # Skip the installation process when the required package is available to the working python.
+    if find_spec("ipykernel") is not None:
+        return
+
+    import subprocess  # this module is required only to install the missing python package
+
     with io.open(os.devnull, mode="wb") as devnull:
         try:
             subprocess.check_call(
@@ -225,37 +270,43 @@ def _provide_required_packages():
             sys.exit(getattr(err, "errno", errno.EPERM))
 
 
-def _write_python_logos(path):
-    logos_spec = {
-        "logo-32x32.png": LOGO_32_32,
-        "logo-64x64.png": LOGO_64_64,
-    }
-
-    for logo_name, logo_image in logos_spec.items():
-        try:
-            with io.open(os.path.join(path, logo_name), mode="wb") as stream_out:
-                # Create a new python logo on the current machine.
-                stream_out.write(base64.b64decode(logo_image))
-        except (IOError, OSError) as err:
-            _logger.error("It's impossible to create python logos on the current machine.")
-            _logger.debug("An unexpected error occurred at this program runtime:", exc_info=True)
-            # Stop this program runtime and return the exit status code.
-            sys.exit(getattr(err, "errno", errno.EIO))
-
-
-def _check_and_remove_broken_kernel(path):
+def _is_broken_kernel(path, interpreters):
     try:
-        with io.open(os.path.join(path, "kernel.json"), mode="rt", encoding="utf-8") as stream_in:
+        with io.open(os.path.join(path, "kernel.json"), mode="rb") as stream_in:
             # Get a path to the location of a kernel interpreter on the current machine.
-            python_path = json.load(stream_in)["argv"][0]
+            python_path = json.loads(stream_in.read().decode("utf-8"))["argv"][0]
 
-        # The provided path to python interpreter is to exist and be accessible to an active user.
-        if not all((os.path.isfile(python_path), os.access(python_path, os.X_OK))):
-            _remove_dir(path)
+        # Check each python interpreter once because many kernels can share the same one.
+        if python_path not in interpreters:
+            # The provided path to python interpreter is to exist and be accessible to a user.
+            is_executable = os.path.isfile(python_path) and os.access(python_path, os.X_OK)
+            interpreters[python_path] = is_executable
+
+        return not interpreters[python_path]
 
     # It's considered python kernels corrupted when these errors occur at this program runtime.
     except (IOError, OSError, IndexError, KeyError, JSONDecodeError):
-        _remove_dir(path)
+        return True
+
+
+def _find_broken_kernels(paths):
+    interpreters = {}
+
+    is_broken_kernel = functools.partial(_is_broken_kernel, interpreters=interpreters)
+
+    try:
+        from concurrent.futures import ThreadPoolExecutor  # noqa
+    except ImportError:
+        # Check python kernels one by one on the previous python versions.
+        kernels_states = [is_broken_kernel(path) for path in paths]
+    else:
+        # Check python kernels in parallel to wait for slow file systems only once.
+        # Threads fill the shared dictionary of interpreters without a lock, so the same
+        # interpreter can be checked twice at once, and both threads store the same result.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            kernels_states = list(executor.map(is_broken_kernel, paths))
+
+    return [path for path, is_broken in zip(paths, kernels_states) if is_broken]
 
 
 def _create_dir(path):
@@ -273,6 +324,8 @@ def _create_dir(path):
 
 
 def _remove_dir(path):
+    import shutil  # this module is required only to remove directory trees
+
     try:
         if os.path.islink(path):
             os.unlink(path)
@@ -286,13 +339,29 @@ def _remove_dir(path):
         sys.exit(getattr(err, "errno", errno.EPERM))
 
 
+def _remove_kernel_dir(path):
+    if os.path.islink(path):
+        # Remove only a link to a python kernel and keep the files it points to.
+        _remove_dir(path)
+        return
+
+    try:
+        # Remove the known files of a python kernel without walking through its directory.
+        for file_name in ("kernel.json",) + tuple(_LOGO_BYTES):
+            os.unlink(os.path.join(path, file_name))
+
+        os.rmdir(path)
+    except OSError:
+        # Use the general way to remove python kernels with unexpected content.
+        _remove_dir(path)
+
+
 def _create_new_kernel(name):
     path = _get_data_path("kernels", name)
 
     _create_dir(path)
     _provide_required_packages()
-    _write_kernel_specification(path)
-    _write_python_logos(path)
+    _write_kernel_files(path)
 
 
 def add_active_environment():
@@ -311,16 +380,20 @@ def remove_active_environment():
         # Stop this program runtime and return the exit status code.
         sys.exit(errno.EPERM)
 
+    path = _get_data_path("kernels", _get_kernel_name())
+
     # Find and remove an active python environment from the working notebook server.
-    for path in glob.glob(_get_data_path("kernels", _get_kernel_name())):
-        _remove_dir(path)
+    if os.path.lexists(path):
+        _remove_kernel_dir(path)
 
 
 def purge_broken_kernels():
     try:
+        kernels_paths = [path for _, path in _list_kernels_in(_get_data_path("kernels"))]
+
         # Find and remove broken python kernels from the working notebook server.
-        for kernel_info in _list_kernels_in(_get_data_path("kernels")):
-            _check_and_remove_broken_kernel(kernel_info.path)
+        for kernel_path in _find_broken_kernels(kernels_paths):
+            _remove_kernel_dir(kernel_path)
     except OSError as err:
         _logger.error("It's impossible to find and remove broken python kernels.")
         _logger.debug("An unexpected error occurred at this program runtime:", exc_info=True)
@@ -346,7 +419,7 @@ def initialize_new_notebook_environment():
 
     # Find and remove all python kernels from the working notebook server.
     for path in jupyter_path("kernels"):
-        if os.path.exists(path) and os.path.isdir(path):
+        if os.path.isdir(path):
             _remove_dir(path)
 
     # Add the main python kernel to the working notebook server on the current machine.
@@ -355,9 +428,14 @@ def initialize_new_notebook_environment():
 
 def show_kernels():
     try:
-        for kernel_info in _list_kernels_in(_get_data_path("kernels")):
-            # Show information about the location of a kernel on the current machine.
-            print("kernel: {0} --> {1}".format(kernel_info.name, kernel_info.path))
+        kernels = [
+            "kernel: {0} --> {1}".format(kernel_name, kernel_path)
+            for kernel_name, kernel_path in _list_kernels_in(_get_data_path("kernels"))
+        ]
+
+        if kernels:
+            # Show information about the location of all kernels on the current machine at once.
+            print("\n".join(kernels))
     except OSError as err:
         _logger.error("It's impossible to show python kernels on the working notebook server.")
         _logger.debug("An unexpected error occurred at this program runtime:", exc_info=True)
@@ -365,7 +443,17 @@ def show_kernels():
         sys.exit(getattr(err, "errno", errno.EPERM))
 
 
+def _configure_logging(level):  # pragma: no cover
+    # Set up the preferred reporting system only when this program runs from the command line.
+    logging.basicConfig(format="%(levelname)s :: %(name)s :: %(message)s")
+
+    # Set a new logging level of the preferred reporting system.
+    _logger.setLevel(level)
+
+
 def main():  # pragma: no cover
+    import argparse  # this module is required only to run this program from the command line
+
     # Create a new instance of the preferred argument parser.
     parser = argparse.ArgumentParser(
         description="Manage python virtual environments on the working notebook server."
@@ -427,8 +515,7 @@ def main():  # pragma: no cover
     try:
         arguments = parser.parse_args()
 
-        # Set a new logging level of the preferred reporting system.
-        _logger.setLevel(arguments.logging_level)
+        _configure_logging(arguments.logging_level)
 
         # Execute a command on the current machine.
         arguments.user_command()
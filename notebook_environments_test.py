@@ -9,15 +9,15 @@ from __future__ import print_function, unicode_literals
 import errno
 import io
 import json
+import logging
 import os
+import shutil
 import stat
 import subprocess
 import sys
+import tempfile
 import unittest
 
-import six
-from pyfakefs.fake_filesystem_unittest import TestCase
-
 import notebook_environments
 
 try:
@@ -25,6 +25,35 @@ try:
 except ImportError:
     import mock
 
+try:
+    from StringIO import StringIO
+except ImportError:
+    # Use the standard text stream to capture the output of this program on python3.
+    from io import StringIO
+
+
+# Set the list of characters that aren't allowed in kernel names.
+INVALID_CHARACTERS = (
+    "#",
+    "$",
+    "%",
+    "&",
+    "+",
+    ":",
+    "<",
+    "=",
+    ">",
+    "?",
+    "@",
+    "[",
+    "]",
+    "^",
+    "{",
+    "|",
+    "}",
+    "~",
+)
+
 
 class SysMock(object):
     def __init__(self):
@@ -50,51 +79,70 @@ class SysMock(object):
 
 
 @mock.patch("notebook_environments.sys", new_callable=SysMock)
-class NotebookEnvironmentsTest(TestCase):
-    data_path = "/root/kernels"
-
+class NotebookEnvironmentsTest(unittest.TestCase):
     # Set the list of fake python kernels.
-    kernels_paths = [
-        "/root/kernels/test1",
-        "/root/kernels/test2",
-        "/root/kernels/test3",
-    ]
+    kernels_names = ["test1", "test2", "test3"]
+
+    @classmethod
+    def setUpClass(cls):
+        # Build fake python kernels once and copy them for each test case from this directory.
+        cls.template_path = tempfile.mkdtemp()
 
-    link_path = "/root/link"
+        # Set the main path to the location of a fake python interpreter.
+        cls.python_path = os.path.join(cls.template_path, "python3")
+        cls._create_python_interpreter()
 
-    # Set the main path to the location of a fake python interpreter.
-    python_path = "/usr/bin/python3"
+        # All fake python kernels share the same specification, so serialize it only once.
+        kernel_spec = json.dumps({"argv": [cls.python_path]}).encode("utf-8")
 
-    def setUp(self):
-        self.setUpPyfakefs()
+        # Create fake python kernels to run tests without damage to the current operating system.
+        for kernel_name in cls.kernels_names:
+            kernel_path = os.path.join(cls.template_path, "kernels", kernel_name)
+            os.makedirs(kernel_path)
 
+            with io.open(os.path.join(kernel_path, "kernel.json"), mode="wb") as stream_out:
+                stream_out.write(kernel_spec)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.template_path, ignore_errors=True)
+
+    @classmethod
+    def _create_python_interpreter(cls):
         # The provided path to python interpreter is to exist and be accessible to an active user.
-        self.fs.create_file(self.python_path, st_mode=stat.S_IXUSR)
+        io.open(cls.python_path, mode="wb").close()
+        os.chmod(cls.python_path, stat.S_IXUSR)
+
+    def setUp(self):
+        # Use a temporary directory to run tests without damage to the current operating system.
+        self.root_path = tempfile.mkdtemp()
 
-        self.fs.create_dir(self.data_path)
+        self.data_path = os.path.join(self.root_path, "kernels")
+        shutil.copytree(os.path.join(self.template_path, "kernels"), self.data_path)
 
-        # Create fake python kernels to run tests without damage to the current operating system.
-        for kernel_path in sorted(self.kernels_paths):
-            self.fs.create_dir(kernel_path)
+        self.kernels_paths = [
+            os.path.join(self.data_path, kernel_name) for kernel_name in self.kernels_names
+        ]
+        self.kernels_specs_paths = [
+            os.path.join(kernel_path, "kernel.json") for kernel_path in self.kernels_paths
+        ]
 
-            with io.open(os.path.join(kernel_path, "kernel.json"), mode="wt") as stream_out:
-                kernel_spec = {
-                    "argv": [
-                        self.python_path,
-                    ],
-                }
+        # Join the paths of files written into the data directory once for all test cases.
+        self.kernel_spec_path = os.path.join(self.data_path, "kernel.json")
+        self.logos_paths = [
+            os.path.join(self.data_path, "logo-32x32.png"),
+            os.path.join(self.data_path, "logo-64x64.png"),
+        ]
 
-                # Create a new kernel specification on the current machine.
-                json.dump(kernel_spec, stream_out)
+        self.link_path = os.path.join(self.root_path, "link")
 
-    def tearDown(self):
-        if os.path.exists(self.data_path):
-            # Remove all the fake python kernels after the each test case from the current machine.
-            self.fs.remove_object(self.data_path)
+        # Forget the values computed by the previous test cases for other fake environments.
+        notebook_environments._get_data_path.cache_clear()
+        notebook_environments._get_kernel_specification.cache_clear()
 
-    def _assertCountEqual(self, *args, **kwargs):
-        # An unordered sequence comparison asserting that the same elements.
-        return six.assertCountEqual(self, *args, **kwargs)
+    def tearDown(self):
+        # Remove all the fake python kernels after the each test case from the current machine.
+        shutil.rmtree(self.root_path, ignore_errors=True)
 
     @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
     def test_virtual_environment_active(self, sys_mock):
@@ -117,11 +165,11 @@ class NotebookEnvironmentsTest(TestCase):
         # Check the current state of an active virtual environment for the working python.
         self.assertFalse(notebook_environments._in_virtual_environment())
 
-    @mock.patch("notebook_environments.platform")
+    @mock.patch("platform.system")
     @mock.patch("notebook_environments.os.path.expanduser")
-    @mock.patch("notebook_environments._logger")
+    @mock.patch("notebook_environments._logger", spec_set=logging.Logger)
     @mock.patch.dict("notebook_environments.os.environ", {"VIRTUAL_ENV": "test"}, clear=True)
-    def test_get_data_path(self, logger_mock, expanduser_mock, platform_mock, sys_mock):
+    def test_get_data_path(self, logger_mock, expanduser_mock, system_mock, sys_mock):
         sys_mock.activate()
 
         # Set a mock path as a user's home directory on the current machine to run this case.
@@ -130,27 +178,32 @@ class NotebookEnvironmentsTest(TestCase):
         paths_spec = {
             "darwin": "/home/user/Library/Jupyter/kernels",
             "linux": "/home/user/.local/share/jupyter/kernels",
-            "windows": "",
-            "": "",
         }
         for os_name, kernels_path in paths_spec.items():
             # Change the name of the current operating system to a new fake name.
-            platform_mock.system.return_value = os_name
+            system_mock.return_value = os_name
+
+            notebook_environments._get_data_path.cache_clear()
+
+            self.assertEqual(notebook_environments._get_data_path("kernels"), kernels_path)
 
-            if kernels_path:
-                self.assertEqual(notebook_environments._get_data_path("kernels"), kernels_path)
-            else:
-                with self.assertRaises(SystemExit) as system_exit:
-                    # Execute a function from the python package under test to run this case.
-                    notebook_environments._get_data_path()
+        for os_name in ("windows", ""):
+            # Change the name of the current operating system to an unsupported fake name.
+            system_mock.return_value = os_name
 
-                    # Check the received error message that was sent from the function under test.
-                    logger_mock.error.assert_called_with(
-                        "This user's operating system isn't supported now."
-                    )
+            notebook_environments._get_data_path.cache_clear()
+
+            with self.assertRaises(SystemExit) as system_exit:
+                # Execute a function from the python package under test to run this case.
+                notebook_environments._get_data_path()
+
+            # Check the received error message that was sent from the function under test.
+            logger_mock.error.assert_called_with(
+                "This user's operating system isn't supported now."
+            )
 
-                    # Check the received exit status code from the function under test.
-                    self.assertEqual(system_exit.exception.code, errno.EPERM)
+            # Check the received exit status code from the function under test.
+            self.assertEqual(system_exit.exception.code, errno.EPERM)
 
     @mock.patch.dict("notebook_environments.os.environ", {"VIRTUAL_ENV": "test"}, clear=True)
     def test_get_kernel_name(self, sys_mock):
@@ -159,34 +212,13 @@ class NotebookEnvironmentsTest(TestCase):
         self.assertEqual(notebook_environments._get_kernel_name(), ".test")
 
     @mock.patch("notebook_environments.os.path.basename")
-    @mock.patch("notebook_environments._logger")
+    @mock.patch("notebook_environments._logger", spec_set=logging.Logger)
     @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
     def test_get_kernel_name_error(self, logger_mock, basename_mock, sys_mock):
         sys_mock.deactivate()
 
-        for invalid_character in sorted(
-            (
-                ":",
-                "?",
-                "[",
-                "]",
-                "{",
-                "}",
-                "@",
-                "&",
-                "#",
-                "%",
-                "^",
-                "+",
-                "<",
-                "=",
-                ">",
-                "|",
-                "~",
-                "$",
-            )
-        ):
-            basename_mock.return_value = "test{0}test".format(invalid_character)
+        for invalid_character in INVALID_CHARACTERS:
+            basename_mock.return_value = "test" + invalid_character + "test"
 
             with self.assertRaises(SystemExit) as system_exit:
                 # Execute a function from the python package under test to run this case.
@@ -204,17 +236,21 @@ class NotebookEnvironmentsTest(TestCase):
     def test_list_kernels_in(self, sys_mock):
         sys_mock.deactivate()
 
-        self._assertCountEqual(  # for python2 and python3
-            list(notebook_environments._list_kernels_in(self.data_path)),
+        # Create a regular file next to the fake python kernels to make sure it's skipped.
+        io.open(os.path.join(self.data_path, "test4"), mode="wb").close()
+
+        # The names of the fake python kernels are sorted, so compare both sides in this order.
+        self.assertEqual(
+            sorted(notebook_environments._list_kernels_in(self.data_path)),
             [
-                notebook_environments._kernel_info(os.path.basename(kernel_path), kernel_path)
+                (os.path.basename(kernel_path), kernel_path)
                 # Generate information about the location of the kernels on the current machine.
-                for kernel_path in sorted(self.kernels_paths)
+                for kernel_path in self.kernels_paths
             ],
         )
 
-    @mock.patch("notebook_environments.os.listdir")
-    @mock.patch("notebook_environments._logger")
+    @mock.patch("notebook_environments.os.listdir", spec=True)
+    @mock.patch("notebook_environments._logger", spec_set=logging.Logger)
     @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
     def test_list_kernels_in_error(self, logger_mock, listdir_mock, sys_mock):
         sys_mock.deactivate()
@@ -241,38 +277,27 @@ class NotebookEnvironmentsTest(TestCase):
             # Execute a function from the python package under test to run this case.
             list(notebook_environments._list_kernels_in(""))
 
-    @mock.patch("notebook_environments._logger")
-    @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
-    def test_write_python_logos(self, logger_mock, sys_mock):
-        sys_mock.deactivate()
+    @mock.patch("notebook_environments.find_spec")
+    @mock.patch("subprocess.check_call", spec=True)
+    @mock.patch("notebook_environments._logger", spec_set=logging.Logger)
+    @mock.patch.dict("notebook_environments.os.environ", {"VIRTUAL_ENV": "test"}, clear=True)
+    def test_provide_required_packages(
+        self,
+        logger_mock,
+        check_call_mock,
+        find_spec_mock,
+        sys_mock,
+    ):
+        sys_mock.activate()
 
         # Execute a function from the python package under test to run this case.
-        notebook_environments._write_python_logos(self.data_path)
-
-        self.assertTrue(os.path.isfile(os.path.join(self.data_path, "logo-32x32.png")))
-        self.assertTrue(os.path.isfile(os.path.join(self.data_path, "logo-64x64.png")))
-
-        with mock.patch("notebook_environments.io.open") as open_mock:
-            # Raise an operating system exception to test a function fault tolerance.
-            open_mock.side_effect = OSError(errno.EPERM, "")
-
-            with self.assertRaises(SystemExit) as system_exit:
-                # Execute a function from the python package under test to run this case.
-                notebook_environments._write_python_logos(self.data_path)
-
-                # Check the received error message that was sent from the function under test.
-                logger_mock.error.assert_called_with(
-                    "It's impossible to create python logos on the current machine."
-                )
+        notebook_environments._provide_required_packages()
 
-                # Check the received exit status code from the function under test.
-                self.assertEqual(system_exit.exception.code, errno.EPERM)
+        # Check that the installation process is skipped for the available python package.
+        self.assertFalse(check_call_mock.called)
 
-    @mock.patch("notebook_environments.subprocess.check_call")
-    @mock.patch("notebook_environments._logger")
-    @mock.patch.dict("notebook_environments.os.environ", {"VIRTUAL_ENV": "test"}, clear=True)
-    def test_provide_required_packages(self, logger_mock, check_call_mock, sys_mock):
-        sys_mock.activate()
+        # Make the required python package unavailable to the working python interpreter.
+        find_spec_mock.return_value = None
 
         # Execute a function from the python package under test to run this case.
         notebook_environments._provide_required_packages()
@@ -300,9 +325,9 @@ class NotebookEnvironmentsTest(TestCase):
             # Check the received exit status code from the function under test.
             self.assertEqual(system_exit.exception.code, errno.EPERM)
 
-    @mock.patch("notebook_environments._logger")
+    @mock.patch("notebook_environments._logger", spec_set=logging.Logger)
     @mock.patch.dict("notebook_environments.os.environ", {"VIRTUAL_ENV": "test"}, clear=True)
-    def test_write_kernel_specification(self, logger_mock, sys_mock):
+    def test_write_kernel_files(self, logger_mock, sys_mock):
         sys_mock.activate()
 
         kernel_spec = {
@@ -317,35 +342,37 @@ class NotebookEnvironmentsTest(TestCase):
             # Set the main interpreter to run python code cells on the working notebook server.
             "language": "python",
         }
-        kernel_spec_path = os.path.join(self.data_path, "kernel.json")
 
         # Execute a function from the python package under test to run this case.
-        notebook_environments._write_kernel_specification(self.data_path)
+        notebook_environments._write_kernel_files(self.data_path)
 
-        self.assertTrue(os.path.exists(kernel_spec_path) and os.path.isfile(kernel_spec_path))
+        self.assertTrue(os.path.isfile(self.kernel_spec_path))
 
-        with io.open(kernel_spec_path, mode="rt", encoding="utf-8") as stream_in:
+        with io.open(self.kernel_spec_path, mode="rb") as stream_in:
             # Check the correctness of the current settings for the installed kernel system.
-            self.assertEqual(json.load(stream_in), kernel_spec)
+            self.assertEqual(json.loads(stream_in.read().decode("utf-8")), kernel_spec)
 
-        with mock.patch("notebook_environments.io.open") as open_mock:
+        for logo_path in self.logos_paths:
+            self.assertTrue(os.path.isfile(logo_path))
+
+        with mock.patch("notebook_environments.os.open") as open_mock:
             # Raise an operating system exception to test a function fault tolerance.
             open_mock.side_effect = OSError(errno.EPERM, "")
 
             with self.assertRaises(SystemExit) as system_exit:
                 # Execute a function from the python package under test to run this case.
-                notebook_environments._write_kernel_specification(self.data_path)
+                notebook_environments._write_kernel_files(self.data_path)
 
                 # Check the received error message that was sent from the function under test.
                 logger_mock.error.assert_called_with(
-                    "It's impossible to create a new specification on the current machine."
+                    "It's impossible to create kernel files on the current machine."
                 )
 
                 # Check the received exit status code from the function under test.
                 self.assertEqual(system_exit.exception.code, errno.EPERM)
 
-    @mock.patch("notebook_environments.os.makedirs")
-    @mock.patch("notebook_environments._logger")
+    @mock.patch("notebook_environments.os.makedirs", spec=True)
+    @mock.patch("notebook_environments._logger", spec_set=logging.Logger)
     @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
     def test_create_dir(self, logger_mock, makedirs_mock, sys_mock):
         sys_mock.deactivate()
@@ -377,8 +404,8 @@ class NotebookEnvironmentsTest(TestCase):
             # Check the received exit status code from the function under test.
             self.assertEqual(system_exit.exception.code, errno.EPERM)
 
-    @mock.patch("notebook_environments.shutil.rmtree")
-    @mock.patch("notebook_environments._logger")
+    @mock.patch("shutil.rmtree", spec=True)
+    @mock.patch("notebook_environments._logger", spec_set=logging.Logger)
     @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
     def test_remove_dir(self, logger_mock, rmtree_mock, sys_mock):
         sys_mock.deactivate()
@@ -404,22 +431,50 @@ class NotebookEnvironmentsTest(TestCase):
             # Check the received exit status code from the function under test.
             self.assertEqual(system_exit.exception.code, errno.EPERM)
 
-        self.fs.create_symlink(self.link_path, self.data_path)
+        os.symlink(self.data_path, self.link_path)
 
         # Execute a function from the python package under test to run this case.
         notebook_environments._remove_dir(self.link_path)
 
         self.assertFalse(os.path.exists(self.link_path))
 
+    @mock.patch("notebook_environments._remove_dir")
+    @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
+    def test_remove_kernel_dir(self, remove_dir_mock, sys_mock):
+        sys_mock.deactivate()
+
+        # Create the full set of files of a python kernel on the current machine.
+        notebook_environments._write_kernel_files(self.kernels_paths[0])
+
+        # Execute a function from the python package under test to run this case.
+        notebook_environments._remove_kernel_dir(self.kernels_paths[0])
+
+        self.assertFalse(os.path.exists(self.kernels_paths[0]))
+        self.assertFalse(remove_dir_mock.called)
+
+        # Execute a function from the python package under test to run this case.
+        notebook_environments._remove_kernel_dir(self.kernels_paths[1])
+
+        # Check that the general way is used to remove a python kernel without logos.
+        remove_dir_mock.assert_called_with(self.kernels_paths[1])
+
+        os.symlink(self.kernels_paths[2], self.link_path)
+
+        # Execute a function from the python package under test to run this case.
+        notebook_environments._remove_kernel_dir(self.link_path)
+
+        # Check that the general way is used to remove a link to a python kernel.
+        remove_dir_mock.assert_called_with(self.link_path)
+
+        self.assertTrue(os.path.isfile(self.kernels_specs_paths[2]))
+
     @mock.patch("notebook_environments._create_dir")
     @mock.patch("notebook_environments._provide_required_packages")
-    @mock.patch("notebook_environments._write_kernel_specification")
-    @mock.patch("notebook_environments._write_python_logos")
+    @mock.patch("notebook_environments._write_kernel_files")
     @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
     def test_create_new_kernel(
         self,
-        write_python_logos_mock,
-        write_kernel_specification_mock,
+        write_kernel_files_mock,
         provide_required_packages_mock,
         create_dir_mock,
         sys_mock,
@@ -431,8 +486,7 @@ class NotebookEnvironmentsTest(TestCase):
 
         self.assertTrue(create_dir_mock.called)
         self.assertTrue(provide_required_packages_mock.called)
-        self.assertTrue(write_kernel_specification_mock.called)
-        self.assertTrue(write_python_logos_mock.called)
+        self.assertTrue(write_kernel_files_mock.called)
 
     @mock.patch("notebook_environments._create_new_kernel")
     @mock.patch.dict("notebook_environments.os.environ", {"VIRTUAL_ENV": "test"}, clear=True)
@@ -446,7 +500,7 @@ class NotebookEnvironmentsTest(TestCase):
         self.assertTrue(create_new_kernel_mock.called)
 
     @mock.patch("notebook_environments._create_new_kernel")
-    @mock.patch("notebook_environments._logger")
+    @mock.patch("notebook_environments._logger", spec_set=logging.Logger)
     @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
     def test_add_not_active_environment(self, logger_mock, create_new_kernel_mock, sys_mock):
         sys_mock.deactivate()
@@ -478,10 +532,10 @@ class NotebookEnvironmentsTest(TestCase):
 
         self.assertFalse(os.path.exists(self.kernels_paths[0]))
 
-    @mock.patch("notebook_environments._remove_dir")
-    @mock.patch("notebook_environments._logger")
+    @mock.patch("notebook_environments._remove_kernel_dir")
+    @mock.patch("notebook_environments._logger", spec_set=logging.Logger)
     @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
-    def test_remove_not_active_environment(self, logger_mock, remove_dir_mock, sys_mock):
+    def test_remove_not_active_environment(self, logger_mock, remove_kernel_dir_mock, sys_mock):
         sys_mock.deactivate()
 
         with self.assertRaises(SystemExit) as system_exit:
@@ -489,7 +543,7 @@ class NotebookEnvironmentsTest(TestCase):
             notebook_environments.remove_active_environment()
 
             # Check for correctness execution of the current function.
-            self.assertFalse(remove_dir_mock.called)
+            self.assertFalse(remove_kernel_dir_mock.called)
 
             # Check the received error message that was sent from the function under test.
             logger_mock.error.assert_called_with(
@@ -507,7 +561,8 @@ class NotebookEnvironmentsTest(TestCase):
         get_data_path_mock.return_value = self.data_path
 
         # Remove a fake python interpreter from the current machine.
-        self.fs.remove_object(sys_mock.executable)
+        os.remove(self.python_path)
+        self.addCleanup(self._create_python_interpreter)
 
         # Execute a function from the python package under test to run this case.
         notebook_environments.purge_broken_kernels()
@@ -516,7 +571,7 @@ class NotebookEnvironmentsTest(TestCase):
         self.assertFalse(os.listdir(self.data_path))
 
     @mock.patch("notebook_environments._list_kernels_in")
-    @mock.patch("notebook_environments._logger")
+    @mock.patch("notebook_environments._logger", spec_set=logging.Logger)
     @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
     def test_remove_dead_kernels_error(self, logger_mock, list_kernels_in_mock, sys_mock):
         sys_mock.deactivate()
@@ -536,40 +591,70 @@ class NotebookEnvironmentsTest(TestCase):
             # Check the received exit status code from the function under test.
             self.assertEqual(system_exit.exception.code, errno.EPERM)
 
-    @mock.patch("notebook_environments._remove_dir")
     @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
-    def test_check_and_remove_broken_kernel(self, remove_dir_mock, sys_mock):
+    def test_is_broken_kernel(self, sys_mock):
         sys_mock.deactivate()
 
+        self.assertFalse(notebook_environments._is_broken_kernel(self.kernels_paths[0], {}))
+
         with mock.patch("notebook_environments.io.open") as open_mock:
             # Raise an operating system exception to test a function fault tolerance.
             open_mock.side_effect = OSError(errno.EPERM, "")
 
-            # Execute a function from the python package under test to run this case.
-            notebook_environments._check_and_remove_broken_kernel(self.kernels_paths[0])
+            # Check that a python kernel without the readable specification is broken.
+            self.assertTrue(notebook_environments._is_broken_kernel(self.kernels_paths[0], {}))
+
+        # Use the known state of a python interpreter instead of checking it another time.
+        self.assertTrue(
+            notebook_environments._is_broken_kernel(
+                self.kernels_paths[1], {self.python_path: False}
+            )
+        )
+
+    @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
+    def test_find_broken_kernels(self, sys_mock):
+        sys_mock.deactivate()
+
+        self.assertEqual(notebook_environments._find_broken_kernels([]), [])
 
-            # Check the correctness of the passed arguments to a function.
-            remove_dir_mock.assert_called_with(self.kernels_paths[0])
+        with io.open(self.kernels_specs_paths[1], mode="wb") as stream_out:
+            # Make the kernel specification corrupted to test a function fault tolerance.
+            stream_out.write(b"{")
 
-    @mock.patch("notebook_environments.print")
+        self.assertEqual(
+            notebook_environments._find_broken_kernels(self.kernels_paths),
+            [self.kernels_paths[1]],
+        )
+
+    @mock.patch("sys.stdout", new_callable=StringIO)
     @mock.patch("notebook_environments._get_data_path")
     @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
-    def test_show_kernels(self, get_data_path_mock, print_mock, sys_mock):
+    def test_show_kernels(self, get_data_path_mock, stdout_mock, sys_mock):
         sys_mock.deactivate()
 
         get_data_path_mock.return_value = self.data_path
 
-        self.fs.remove_object(self.kernels_paths[0])
-        self.fs.remove_object(self.kernels_paths[1])
+        shutil.rmtree(self.kernels_paths[0])
+        shutil.rmtree(self.kernels_paths[1])
+
+        kernel_info = "kernel: test3 --> {0}\n".format(self.kernels_paths[2])
 
         # Execute a function from the python package under test to run this case.
         notebook_environments.show_kernels()
 
-        # Check the correctness of the passed arguments to a function.
-        print_mock.assert_called_with("kernel: test3 --> /root/kernels/test3")
+        # Check the correctness of the information shown to a user.
+        self.assertEqual(stdout_mock.getvalue(), kernel_info)
+
+        shutil.rmtree(self.kernels_paths[2])
+
+        # Execute a function from the python package under test to run this case.
+        notebook_environments.show_kernels()
+
+        # Check that nothing is shown when there are no python kernels.
+        self.assertEqual(stdout_mock.getvalue(), kernel_info)
 
     @mock.patch("notebook_environments._list_kernels_in")
-    @mock.patch("notebook_environments._logger")
+    @mock.patch("notebook_environments._logger", spec_set=logging.Logger)
     @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
     def test_show_kernels_error(self, logger_mock, list_kernels_in_mock, sys_mock):
         sys_mock.deactivate()
@@ -591,6 +676,8 @@ class NotebookEnvironmentsTest(TestCase):
 
     @mock.patch("notebook_environments._create_new_kernel")
     @mock.patch("notebook_environments._get_data_path")
+    # Hide real jupyter paths to remove only the fake python kernels from the current machine.
+    @mock.patch.dict("sys.modules", {"jupyter_core.paths": None})
     @mock.patch.dict("notebook_environments.os.environ", {}, clear=True)
     def test_initialize_new_notebook_environment(
         self,
@@ -605,10 +692,12 @@ class NotebookEnvironmentsTest(TestCase):
         # Execute a function from the python package under test to run this case.
         notebook_environments.initialize_new_notebook_environment()
 
+        self.assertFalse(os.path.exists(self.data_path))
+
         # Check the correctness of the passed arguments to a function.
         create_new_kernel_mock.assert_called_with("python3")
 
-    @mock.patch("notebook_environments._logger")
+    @mock.patch("notebook_environments._logger", spec_set=logging.Logger)
     @mock.patch.dict("notebook_environments.os.environ", {"VIRTUAL_ENV": "test"}, clear=True)
     def test_initialize_new_notebook_environment_error(self, logger_mock, sys_mock):
         sys_mock.activate()
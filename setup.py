@@ -7,70 +7,84 @@
 from __future__ import print_function, unicode_literals
 
 import io
-import platform
+import re
+
+from setuptools import setup
+
+
+# Set the main location of the source code of this python package.
+_REPO = "https://github.com/vladpunko/notebook-environments"
+
+# Find the assignment of the version string in the source code of this python package.
+_VERSION_RE = re.compile(r"^__version__\s*=\s*[\"']([^\"']+)", flags=re.MULTILINE)
+
+
+def _read_version():
+    # Never import the module under install here: that runs all of its top-level code at build
+    # time. Use importlib.metadata.version("notebook-environments") once this package is installed.
+    with io.open("notebook_environments.py", mode="rt", encoding="utf-8") as stream_in:
+        return _VERSION_RE.search(stream_in.read()).group(1)
+
 
 try:
-    from setuptools import setup
-except ImportError:
-    # Use the standard module to build and distribute this python package.
-    from distutils.core import setup
+    with io.open("README.md", mode="rb") as stream_in:
+        # Load the readme file and use it as the long description for this python package.
+        long_description = stream_in.read().decode("utf-8")
+except IOError:  # an alias of OSError on python3
+    # Build this python package without the long description from trimmed source trees.
+    long_description = ""
+
+# Declare the markup of the long description only when there is something to render.
+long_description_content_type = "text/markdown" if long_description else None
+
 
-from notebook_environments import __version__
+# Describe this python package for the package index with the list of trove classifiers.
+_CLASSIFIERS = [
+    "Intended Audience :: Developers",
+    "Intended Audience :: Science/Research",
+    "Intended Audience :: System Administrators",
 
+    "License :: OSI Approved :: MIT License",
 
-_os_name = platform.system().lower()
-# Make sure this python package is compatible with the current operating system.
-if _os_name == "windows" or _os_name.startswith("cygwin"):
-    raise RuntimeError("The notebook-environments program doesn't support windows at this moment.")
+    "Operating System :: MacOS :: MacOS X",
+    "Operating System :: POSIX",
 
+    "Programming Language :: Python :: 2",
+    "Programming Language :: Python :: 2.7",
+    "Programming Language :: Python :: 3",
+    "Programming Language :: Python :: 3.5",
+    "Programming Language :: Python :: 3.6",
+    "Programming Language :: Python :: 3.7",
+    "Programming Language :: Python :: 3.8",
+    "Programming Language :: Python :: 3.9",
+    "Programming Language :: Python :: 3.10",
+    "Programming Language :: Python :: 3.11",
+    "Programming Language :: Python :: 3.12",
 
-with io.open("README.md", mode="rt", encoding="utf-8") as stream_in:
-    # Load the readme file and use it as the long description for this python package.
-    long_description = stream_in.read()
+    "Topic :: Software Development :: Libraries :: Python Modules",
+    "Topic :: Utilities",
+]
 
 
 setup(
     name="notebook-environments",
-    version=__version__,
+    version=_read_version(),
 
     description="Manage python virtual environments on the working notebook server",
     long_description=long_description,
-    long_description_content_type="text/markdown",
+    long_description_content_type=long_description_content_type,
     author="Vladislav Punko",
     author_email="iam.vlad.punko@gmail.com",
     license="MIT",
-    url="https://github.com/vladpunko/notebook-environments",
+    url=_REPO,
     project_urls={
-        "Issue tracker": "https://github.com/vladpunko/notebook-environments/issues",
-        "Source code": "https://github.com/vladpunko/notebook-environments",
+        "Issue tracker": _REPO + "/issues",
+        "Source code": _REPO,
     },
 
-    python_requires=">=2.7",  # this package is to work on python version 2.7 or later
+    # This package works on python 2.7 and python 3.5 or later as its classifiers state.
+    python_requires=">=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*, !=3.4.*",
     platforms=["macOS", "POSIX"],
     py_modules=["notebook_environments"],
-    classifiers=[
-        "Intended Audience :: Developers",
-        "Intended Audience :: Science/Research",
-        "Intended Audience :: System Administrators",
-
-        "License :: OSI Approved :: MIT License",
-
-        "Operating System :: MacOS :: MacOS X",
-        "Operating System :: POSIX",
-
-        "Programming Language :: Python :: 2",
-        "Programming Language :: Python :: 2.7",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-
-        "Topic :: Software Development :: Libraries :: Python Modules",
-        "Topic :: Utilities",
-    ],
+    classifiers=_CLASSIFIERS,
 )